@@ -1,42 +1,259 @@
 # app.py - Production-Ready Event Management System
 import os
+import csv
+import io
+import time
 import logging
-from datetime import datetime, timedelta
+from collections import namedtuple
+from uuid import uuid4
+import json
+import hashlib
+import re
+from decimal import Decimal
+from datetime import date, datetime, timedelta, timezone
 from functools import wraps
-from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, abort, current_app, has_app_context
+from flask.json.provider import JSONProvider
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from flask_cors import CORS
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask_caching import Cache
+from flask_migrate import Migrate, stamp, upgrade
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import and_, case, exists, func, insert, inspect, or_, select, event as sa_event
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import make_transient_to_detached, object_session, selectinload, undefer_group
+from sqlalchemy.pool import NullPool
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from dotenv import load_dotenv
+import orjson
 
 
 from models import (
-    db, User, Event, Venue, Package, Vendor, Payment, Guest, EventVendor,
+    db, User, Event, Venue, Package, Vendor, Payment, BillingProfile, Guest, EventVendor,
     AuditLog, UserRole, EventStatus, PaymentStatus )
 
+# Enum members by name for form and query-string input
+_EVENT_STATUS_BY_NAME = dict(EventStatus.__members__)
+_USER_ROLE_BY_NAME = dict(UserRole.__members__)
+
+# Payment amounts: digits with at most two decimal places
+_AMOUNT_RE = re.compile(r'\d+(\.\d{1,2})?')
+
+
+# Argon2id: memory-hard and much cheaper in wall time than 600k PBKDF2 rounds
+password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
+
+# Precomputed hash of the default admin password (Admin@123) so seeding does no hashing
+DEFAULT_ADMIN_PASSWORD_HASH = (
+    '$argon2id$v=19$m=65536,t=2,p=2$JA0lea7aAGt8CDFDr9of2g$tGL5BFb7xD6IgIdmBUjk6QW6J6KuyYWXildyX0vleFE')
+
+
+def hash_password(password):
+    """Hash a password for storage"""
+    return password_hasher.hash(password)
+
+
+def verify_password(password_hash, password):
+    """Check a password against an Argon2 or legacy Werkzeug hash"""
+    if password_hash.startswith('$argon2'):
+        try:
+            return password_hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(password_hash, password)
+
+
+def password_needs_rehash(password_hash):
+    """True for legacy Werkzeug hashes or Argon2 hashes with outdated parameters"""
+    if not password_hash.startswith('$argon2'):
+        return True
+    return password_hasher.check_needs_rehash(password_hash)
+
+
+def parse_event_start(date_str, time_str):
+    """Combine the form's YYYY-MM-DD date and HH:MM time into one datetime"""
+    return datetime.fromisoformat(f'{date_str}T{time_str or "14:00"}')
+
+
+# (monotonic timestamp, cached aware UTC datetime)
+_now_cache = [0.0, None]
+
+
+def utc_now():
+    """Current aware UTC time, refreshed at most once per second"""
+    t = time.monotonic()
+    if _now_cache[1] is None or t - _now_cache[0] > 1.0:
+        _now_cache[:] = [t, datetime.now(timezone.utc)]
+    return _now_cache[1]
+
+
+# One page of a keyset-paginated listing; cursor is the position it started from
+KeysetPage = namedtuple('KeysetPage', ['items', 'cursor', 'next_cursor'])
+
+
+def paginate_keyset(query, model, cursor=None, per_page=20):
+    """Page newest-first by (created_at, id) without OFFSET or COUNT queries"""
+    if cursor:
+        try:
+            created_at, _, row_id = cursor.rpartition('_')
+            created_at, row_id = datetime.fromisoformat(created_at), int(row_id)
+        except ValueError:
+            cursor = None  # Malformed cursors restart from the first page
+        else:
+            query = query.filter(or_(
+                model.created_at < created_at,
+                and_(model.created_at == created_at, model.id < row_id)))
+    
+    items = query.order_by(model.created_at.desc(), model.id.desc()).limit(per_page + 1).all()
+    next_cursor = None
+    if len(items) > per_page:
+        items = items[:per_page]
+        next_cursor = f'{items[-1].created_at.isoformat()}_{items[-1].id}'
+    return KeysetPage(items, cursor, next_cursor)
+
+
+def _orjson_default(obj):
+    """Serialize the types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson for faster jsonify responses"""
+    
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_orjson_default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            # orjson takes no hooks; the session serializer needs object_hook
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+# Catalog list invalidation. Mapper and session listeners are process-global, so they
+# are registered once here; each app exposes its own memoized lists in app.extensions.
+def mark_catalog_stale(mapper, connection, target):
+    # Flushed but not yet committed; drop the list only once the change is visible
+    object_session(target).info.setdefault('stale_catalog', set()).add(mapper.class_)
+
+
+for _model in (Package, Venue, Vendor):
+    for _mapper_event in ('after_insert', 'after_update', 'after_delete'):
+        sa_event.listen(_model, _mapper_event, mark_catalog_stale)
+
+
+@sa_event.listens_for(db.session, 'after_commit')
+def invalidate_catalog(session):
+    stale = session.info.pop('stale_catalog', ())
+    if not stale or not has_app_context():
+        return
+    cache, catalog_lists = current_app.extensions['catalog_lists']
+    for model in stale:
+        cache.delete_memoized(catalog_lists[model])
+
+
+@sa_event.listens_for(db.session, 'after_rollback')
+def discard_stale_catalog(session):
+    session.info.pop('stale_catalog', None)
+
 
 def create_app() -> Flask:
     load_dotenv()
 
     # Initialize Flask app
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
-    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///events.db')
+    database_uri = os.environ.get('DATABASE_URL', 'sqlite:///events.db')
+    in_memory_db = ':memory:' in database_uri or database_uri == 'sqlite://'
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(days=7)
     app.config['SESSION_COOKIE_SECURE'] = os.environ.get('SESSION_COOKIE_SECURE', False)
     app.config['SESSION_COOKIE_HTTPONLY'] = True
     app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+    app.config['TEMPLATES_AUTO_RELOAD'] = False  # Templates only change on deploy
+    app.config['SQLALCHEMY_RECORD_QUERIES'] = False
+    if os.environ.get('DB_POOL') == 'null':
+        # Serverless: open a connection per checkout so idle instances hold none
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'poolclass': NullPool}
+    elif not in_memory_db:
+        # In-memory SQLite uses a static single-connection pool that takes no sizing
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+            'pool_size': int(os.environ.get('DB_POOL_SIZE', 20)),
+            'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+            'pool_pre_ping': True,
+            'pool_recycle': 1800
+        }
+        if database_uri.startswith('sqlite'):
+            # Pooled SQLite connections are handed between request threads
+            app.config['SQLALCHEMY_ENGINE_OPTIONS']['connect_args'] = {'check_same_thread': False}
+
+    # SimpleCache is per-process: invalidation only reaches the worker that made the
+    # change, and other workers stay stale until the TTL expires. gunicorn.conf.py
+    # switches to FileSystemCache; use RedisCache when running on several hosts.
+    app.config['CACHE_TYPE'] = os.environ.get('CACHE_TYPE', 'SimpleCache')
+    if app.config['CACHE_TYPE'] == 'FileSystemCache':
+        # Shared by every worker on the host, kept out of the world-writable temp dir
+        app.config['CACHE_DIR'] = os.environ.get('CACHE_DIR', os.path.join(app.instance_path, 'cache'))
+    app.config['CACHE_DEFAULT_TIMEOUT'] = 60
 
     # Initialize extensions
     db.init_app(app)
+    Migrate(app, db, directory=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations'),
+            render_as_batch=True)  # SQLite can only ALTER by rebuilding the table
     CORS(app)
+    cache = Cache(app)
+
+    # Skip the per-render mtime check and share compiled templates across workers;
+    # without JINJA_CACHE_DIR, Jinja picks a private (0700, owner-checked) temp directory
+    jinja_cache_dir = os.environ.get('JINJA_CACHE_DIR')
+    app.jinja_env.auto_reload = False
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
 
     # Configure logging
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
+    # ============================================
+    # DATABASE TUNING
+    # ============================================
+    SLOW_QUERY_SECONDS = 0.1
+
+    def set_sqlite_pragmas(dbapi_conn, connection_record):
+        """WAL lets readers run alongside the single writer; SQLite enforces FKs only when asked"""
+        cursor = dbapi_conn.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')  # ON DELETE SET NULL on audit_logs.admin_id
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.execute('PRAGMA busy_timeout=5000')
+        cursor.close()
+
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    def log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_start
+        if elapsed > SLOW_QUERY_SECONDS:
+            logger.warning('Slow query (%.0f ms): %s', elapsed * 1000, statement)
+
+    with app.app_context():
+        if database_uri.startswith('sqlite') and not in_memory_db:
+            sa_event.listen(db.engine, 'connect', set_sqlite_pragmas)
+        sa_event.listen(db.engine, 'before_cursor_execute', start_query_timer)
+        sa_event.listen(db.engine, 'after_cursor_execute', log_slow_query)
+
     # Login Manager
     login_manager = LoginManager()
     login_manager.init_app(app)
@@ -47,7 +264,14 @@ def create_app() -> Flask:
 
     @login_manager.user_loader
     def load_user(user_id):
-        return User.query.get(int(user_id))
+        fields = cached_user(int(user_id))
+        if fields is None:
+            return None
+        # Rebuild the user from the cached columns and attach it without a SELECT;
+        # any other column loads on first access
+        user = User(**fields)
+        make_transient_to_detached(user)
+        return db.session.merge(user, load=False)
 
 
     # ============================================
@@ -57,7 +281,7 @@ def create_app() -> Flask:
         """Decorator to require admin role"""
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if not current_user.is_authenticated or not current_user.is_admin():
+            if not current_user.is_authenticated or not current_user.is_admin:
                 flash('You do not have permission to access this page.', 'error')
                 return redirect(url_for('home'))
             return f(*args, **kwargs)
@@ -68,7 +292,7 @@ def create_app() -> Flask:
         """Decorator to require client role"""
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if not current_user.is_authenticated or not current_user.is_client():
+            if not current_user.is_authenticated or not current_user.is_client:
                 flash('You do not have permission to access this page.', 'error')
                 return redirect(url_for('home'))
             return f(*args, **kwargs)
@@ -76,8 +300,8 @@ def create_app() -> Flask:
 
 
     def log_audit(action, entity_type, entity_id, old_values=None, new_values=None, description=None):
-        """Log an audit entry"""
-        if current_user.is_authenticated and current_user.is_admin():
+        """Add an audit entry to the current transaction (the caller commits)"""
+        if current_user.is_authenticated and current_user.is_admin:
             audit = AuditLog(
                 action=action,
                 entity_type=entity_type,
@@ -88,7 +312,6 @@ def create_app() -> Flask:
                 description=description
             )
             db.session.add(audit)
-            db.session.commit()
 
 
     # ============================================
@@ -98,7 +321,7 @@ def create_app() -> Flask:
     def inject_globals():
         """Inject global variables into templates"""
         return {
-            'current_date': datetime.utcnow(),
+            'current_date': utc_now(),
             'EventStatus': EventStatus,
             'PaymentStatus': PaymentStatus
         }
@@ -107,21 +330,119 @@ def create_app() -> Flask:
     # ============================================
     # ERROR HANDLERS
     # ============================================
+    # Rendered error pages keyed by (status code, navbar variant)
+    error_page_cache = {}
+
+    def render_error_page(code):
+        """Render an error page once per navbar variant and reuse the HTML"""
+        template = f'errors/{code}.html'
+        if app.debug or session.get('_flashes'):
+            # Flash messages are per-user, so those pages are never shared
+            return render_template(template), code
+        
+        if not current_user.is_authenticated:
+            variant = 'anonymous'
+        else:
+            variant = 'admin' if current_user.is_admin else 'client'
+        
+        html = error_page_cache.get((code, variant))
+        if html is None:
+            html = error_page_cache[(code, variant)] = render_template(template)
+        return html, code
+
+
     @app.errorhandler(404)
     def not_found(error):
-        return render_template('errors/404.html'), 404
+        return render_error_page(404)
 
 
     @app.errorhandler(403)
     def forbidden(error):
-        return render_template('errors/403.html'), 403
+        return render_error_page(403)
 
 
     @app.errorhandler(500)
     def internal_error(error):
-        logger.error(f'Internal server error: {error}')
+        logger.error('Internal server error: %s', error)
         db.session.rollback()
-        return render_template('errors/500.html'), 500
+        return render_error_page(500)
+
+
+    # ============================================
+    # CACHED LOOKUPS
+    # ============================================
+    @cache.memoize(timeout=300)
+    def active_packages():
+        """Bookable packages for the home page and event forms"""
+        return Package.query.filter_by(is_active=True).all()
+
+
+    @cache.memoize(timeout=300)
+    def available_venues():
+        """Bookable venues for the home page and event forms"""
+        return Venue.query.filter_by(is_available=True).all()
+
+
+    @cache.memoize(timeout=300)
+    def available_vendors():
+        """Bookable vendors for the event vendor picker"""
+        return Vendor.query.filter_by(is_available=True).all()
+
+
+    # Read by invalidate_catalog after a commit touches one of these models
+    app.extensions['catalog_lists'] = (cache, {
+        Package: active_packages, Venue: available_venues, Vendor: available_vendors})
+
+
+    @cache.memoize(timeout=30)
+    def cached_user(user_id):
+        """Session-loader columns for a user; invalidate after writing to a user"""
+        # Only what most requests read: the password hash and contact details stay out of the cache
+        row = db.session.execute(
+            select(User.id, User.username, User.role, User.is_active).where(User.id == user_id)
+        ).first()
+        return row._asdict() if row else None
+
+
+    @cache.memoize(timeout=3600)
+    def package_json(package_id, version):
+        """Serialized package body and ETag; version (updated_at) changes on every edit"""
+        package = db.session.get(Package, package_id)
+        body = app.json.dumps({
+            'success': True,
+            'package': {
+                'id': package.id,
+                'name': package.name,
+                'description': package.description,
+                'base_price': package.base_price,
+                'price_per_guest': package.price_per_guest,
+                'max_guests': package.max_guests,
+                'features': package.features,
+                'services_included': package.services_included
+            }
+        })
+        return body, hashlib.md5(body.encode()).hexdigest()
+
+
+    @cache.memoize(timeout=30)
+    def dashboard_stats():
+        """Admin dashboard counts; invalidated on status, payment and user changes"""
+        total_users = User.query.filter_by(role=UserRole.CLIENT).count()
+        total_revenue = db.session.query(func.coalesce(func.sum(Payment.amount), 0.0)) \
+            .filter(Payment.status == PaymentStatus.PAID).scalar()
+        
+        # Events by status (single grouped query)
+        status_breakdown = {status.value: 0 for status in EventStatus}
+        for status, count in db.session.query(Event.status, func.count(Event.id)).group_by(Event.status):
+            status_breakdown[status.value] = count
+        
+        return {
+            'total_users': total_users,
+            'total_events': sum(status_breakdown.values()),
+            'pending_events': status_breakdown[EventStatus.PENDING.value],
+            'total_revenue': total_revenue,
+            'status_breakdown': status_breakdown
+        }
 
 
     # ============================================
@@ -131,16 +452,12 @@ def create_app() -> Flask:
     def home():
         """Home page"""
         if current_user.is_authenticated:
-            if current_user.is_admin():
+            if current_user.is_admin:
                 return redirect(url_for('admin_dashboard'))
             else:
                 return redirect(url_for('client_dashboard'))
         
-        # Get statistics for home page
-        packages = Package.query.filter_by(is_active=True).limit(6).all()
-        venues = Venue.query.filter_by(is_available=True).limit(6).all()
-        
-        return render_template('home.html', packages=packages, venues=venues)
+        return render_template('home.html', packages=active_packages()[:6], venues=available_venues()[:6])
 
 
     @app.route('/register', methods=['GET', 'POST'])
@@ -176,20 +493,21 @@ def create_app() -> Flask:
                     flash('Username must be at least 3 characters long!', 'error')
                     return redirect(url_for('register'))
                 
-                # Check if user already exists
-                if User.query.filter_by(username=username).first():
-                    flash('Username already exists!', 'error')
-                    return redirect(url_for('register'))
-                
-                if User.query.filter_by(email=email).first():
-                    flash('Email already registered!', 'error')
+                # Check if user already exists (one lookup for both unique fields)
+                existing = db.session.query(User.username, User.email).filter(
+                    or_(User.username == username, User.email == email)).first()
+                if existing:
+                    if existing.username == username:
+                        flash('Username already exists!', 'error')
+                    else:
+                        flash('Email already registered!', 'error')
                     return redirect(url_for('register'))
                 
                 # Create new user
                 user = User(
                     username=username,
                     email=email,
-                    password=generate_password_hash(password),
+                    password=hash_password(password),
                     first_name=first_name,
                     last_name=last_name,
                     phone=phone,
@@ -204,7 +522,7 @@ def create_app() -> Flask:
                 
             except Exception as e:
                 db.session.rollback()
-                logger.error(f'Registration error: {e}')
+                logger.error('Registration error: %s', e)
                 flash('An error occurred during registration. Please try again.', 'error')
                 return redirect(url_for('register'))
         
@@ -227,16 +545,20 @@ def create_app() -> Flask:
                     flash('Username and password are required!', 'error')
                     return redirect(url_for('login'))
                 
-                user = User.query.filter_by(username=username).first()
+                user = User.by_username(username)
                 
-                if user and check_password_hash(user.password, password):
+                if user and verify_password(user.password, password):
                     if not user.is_active:
                         flash('Your account has been deactivated.', 'error')
                         return redirect(url_for('login'))
                     
                     login_user(user, remember=remember)
                     user.last_login = datetime.utcnow()
+                    if password_needs_rehash(user.password):
+                        # Upgrade the stored hash while the plaintext is at hand
+                        user.password = hash_password(password)
                     db.session.commit()
+                    cache.delete_memoized(cached_user, user.id)
                     
                     flash(f'Welcome back, {user.username}!', 'success')
                     
@@ -244,7 +566,7 @@ def create_app() -> Flask:
                     if next_page and next_page.startswith('/'):
                         return redirect(next_page)
                     
-                    if user.is_admin():
+                    if user.is_admin:
                         return redirect(url_for('admin_dashboard'))
                     else:
                         return redirect(url_for('client_dashboard'))
@@ -253,7 +575,7 @@ def create_app() -> Flask:
                     return redirect(url_for('login'))
                     
             except Exception as e:
-                logger.error(f'Login error: {e}')
+                logger.error('Login error: %s', e)
                 flash('An error occurred during login. Please try again.', 'error')
                 return redirect(url_for('login'))
         
@@ -272,21 +594,29 @@ def create_app() -> Flask:
     # ============================================
     # CLIENT ROUTES (Blueprint-like organization)
     # ============================================
+    DASHBOARD_EVENT_LIMIT = 50
+    
     @app.route('/client/dashboard')
     @login_required
     @client_required
     def client_dashboard():
         """Client dashboard"""
-        events = Event.query.filter_by(user_id=current_user.id).order_by(Event.created_at.desc()).all()
+        events = Event.query.filter_by(user_id=current_user.id).order_by(Event.created_at.desc()) \
+            .limit(DASHBOARD_EVENT_LIMIT).all()
         
-        # Statistics
-        total_events = len(events)
-        upcoming_events = len([e for e in events if e.is_upcoming])
-        completed_events = len([e for e in events if e.status == EventStatus.COMPLETED])
-        total_spent = sum(e.total_cost or 0 for e in events)
+        # Statistics (single aggregate query)
+        total_events, upcoming_events, completed_events, total_spent = db.session.query(
+            func.count(Event.id),
+            func.coalesce(func.sum(case(
+                (Event.is_upcoming, 1),
+                else_=0)), 0),
+            func.coalesce(func.sum(case((Event.status == EventStatus.COMPLETED, 1), else_=0)), 0),
+            func.coalesce(func.sum(Event.total_cost), 0)
+        ).filter(Event.user_id == current_user.id).one()
         
         return render_template('client/dashboard.html',
                             events=events,
+                            event_limit=DASHBOARD_EVENT_LIMIT,
                             total_events=total_events,
                             upcoming_events=upcoming_events,
                             completed_events=completed_events,
@@ -311,22 +641,23 @@ def create_app() -> Flask:
                 
                 birthday = request.form.get('birthday')
                 if birthday:
-                    current_user.birthday = datetime.strptime(birthday, '%Y-%m-%d').date()
+                    current_user.birthday = date.fromisoformat(birthday)
                 
                 new_password = request.form.get('new_password', '').strip()
                 if new_password:
                     if len(new_password) < 8:
                         flash('Password must be at least 8 characters!', 'error')
                         return redirect(url_for('client_profile'))
-                    current_user.password = generate_password_hash(new_password)
+                    current_user.password = hash_password(new_password)
                 
                 db.session.commit()
+                cache.delete_memoized(cached_user, current_user.id)
                 flash('Profile updated successfully!', 'success')
                 return redirect(url_for('client_profile'))
                 
             except Exception as e:
                 db.session.rollback()
-                logger.error(f'Profile update error: {e}')
+                logger.error('Profile update error: %s', e)
                 flash('An error occurred while updating profile!', 'error')
                 return redirect(url_for('client_profile'))
         
@@ -338,8 +669,8 @@ def create_app() -> Flask:
     @client_required
     def create_event():
         """Create new event"""
-        packages = Package.query.filter_by(is_active=True).all()
-        venues = Venue.query.filter_by(is_available=True).all()
+        packages = active_packages()
+        venues = available_venues()
         
         if request.method == 'POST':
             try:
@@ -359,14 +690,14 @@ def create_app() -> Flask:
                     return redirect(url_for('create_event'))
                 
                 try:
-                    event_date = datetime.strptime(event_date_str, '%Y-%m-%d')
+                    event_date = parse_event_start(event_date_str, event_time)
                     expected_guest_count = int(expected_guest_count)
                     
                     if expected_guest_count <= 0:
                         flash('Guest count must be positive!', 'error')
                         return redirect(url_for('create_event'))
                     
-                    if event_date <= datetime.utcnow():
+                    if event_date <= utc_now().replace(tzinfo=None):
                         flash('Event date must be in the future!', 'error')
                         return redirect(url_for('create_event'))
                     
@@ -386,7 +717,6 @@ def create_app() -> Flask:
                     name=name,
                     event_type=event_type,
                     event_date=event_date,
-                    event_time=event_time,
                     expected_guest_count=expected_guest_count,
                     user_id=current_user.id,
                     package_id=package_id if package_id else None,
@@ -396,21 +726,20 @@ def create_app() -> Flask:
                     status=EventStatus.PENDING
                 )
                 
-                # Calculate total cost
-                event.calculate_total_cost()
-                
                 db.session.add(event)
-                db.session.commit()
+                db.session.flush()
+                Event.recompute_total_cost(event.id)
                 
                 log_audit('CREATE', 'Event', event.id, None, 
                         {'name': name, 'type': event_type}, 'Event created by client')
+                db.session.commit()
                 
                 flash(f'Event "{name}" created successfully!', 'success')
                 return redirect(url_for('view_event', event_id=event.id))
                 
             except Exception as e:
                 db.session.rollback()
-                logger.error(f'Event creation error: {e}')
+                logger.error('Event creation error: %s', e)
                 flash('An error occurred while creating event!', 'error')
                 return redirect(url_for('create_event'))
         
@@ -421,21 +750,29 @@ def create_app() -> Flask:
     @login_required
     def view_event(event_id):
         """View event details"""
-        event = Event.query.get_or_404(event_id)
+        stmt = Event.select_with_total_paid() \
+            .options(selectinload(Event.package), selectinload(Event.venue), undefer_group('details')) \
+            .where(Event.id == event_id)
+        # Authorization is part of the lookup: clients only match their own events
+        if not current_user.is_admin:
+            stmt = stmt.where(Event.user_id == current_user.id)
         
-        # Check authorization
-        if event.user_id != current_user.id and not current_user.is_admin():
-            flash('You do not have permission to view this event!', 'error')
-            return redirect(url_for('home'))
+        row = db.session.execute(stmt).first()
+        if row is None:
+            abort(404)
         
-        return render_template('client/view_event.html', event=event)
+        event, total_paid = row
+        return render_template('client/view_event.html',
+                            event=event,
+                            total_paid=total_paid,
+                            remaining=max(0, (event.total_cost or 0) - total_paid))
 
 
     @app.route('/client/event/<int:event_id>/edit', methods=['GET', 'POST'])
     @login_required
     def edit_event(event_id):
         """Edit event"""
-        event = Event.query.get_or_404(event_id)
+        event = Event.query.options(undefer_group('details')).get_or_404(event_id)
         
         # Check authorization
         if event.user_id != current_user.id:
@@ -447,38 +784,36 @@ def create_app() -> Flask:
             flash('This event cannot be edited in its current status!', 'error')
             return redirect(url_for('view_event', event_id=event_id))
         
-        packages = Package.query.filter_by(is_active=True).all()
-        venues = Venue.query.filter_by(is_available=True).all()
+        packages = active_packages()
+        venues = available_venues()
         
         if request.method == 'POST':
             try:
                 event.name = request.form.get('name', '').strip()
                 event.event_type = request.form.get('event_type', '').strip()
                 event_date_str = request.form.get('event_date', '')
-                event.event_time = request.form.get('event_time', '14:00')
+                event_time = request.form.get('event_time', '14:00')
                 event.expected_guest_count = int(request.form.get('expected_guest_count', 1))
                 event.package_id = request.form.get('package_id') or None
                 event.venue_id = request.form.get('venue_id') or None
                 event.description = request.form.get('description', '').strip()
                 event.special_requests = request.form.get('special_requests', '').strip()
                 
-                if event_date_str:
-                    event.event_date = datetime.strptime(event_date_str, '%Y-%m-%d')
+                event.event_date = parse_event_start(
+                    event_date_str or event.event_date.date().isoformat(), event_time)
                 
-                # Recalculate total cost
-                event.calculate_total_cost()
                 event.updated_at = datetime.utcnow()
-                
-                db.session.commit()
+                Event.recompute_total_cost(event.id)
                 
                 log_audit('UPDATE', 'Event', event.id, None, None, 'Event updated by client')
+                db.session.commit()
                 
                 flash('Event updated successfully!', 'success')
                 return redirect(url_for('view_event', event_id=event_id))
                 
             except Exception as e:
                 db.session.rollback()
-                logger.error(f'Event edit error: {e}')
+                logger.error('Event edit error: %s', e)
                 flash('An error occurred while updating event!', 'error')
                 return redirect(url_for('edit_event', event_id=event_id))
         
@@ -504,16 +839,15 @@ def create_app() -> Flask:
         try:
             event_name = event.name
             db.session.delete(event)
-            db.session.commit()
-            
             log_audit('DELETE', 'Event', event_id, None, None, f'Event deleted by client')
+            db.session.commit()
             
             flash(f'Event "{event_name}" deleted successfully!', 'success')
             return redirect(url_for('client_dashboard'))
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f'Event deletion error: {e}')
+            logger.error('Event deletion error: %s', e)
             flash('An error occurred while deleting event!', 'error')
             return redirect(url_for('view_event', event_id=event_id))
 
@@ -528,7 +862,7 @@ def create_app() -> Flask:
         event = Event.query.get_or_404(event_id)
         
         # Check authorization
-        if event.user_id != current_user.id and not current_user.is_admin():
+        if event.user_id != current_user.id and not current_user.is_admin:
             flash('You do not have permission to view guests!', 'error')
             return redirect(url_for('home'))
         
@@ -570,20 +904,91 @@ def create_app() -> Flask:
             )
             
             db.session.add(guest)
-            db.session.commit()
+            db.session.flush()
             
             log_audit('CREATE', 'Guest', guest.id, None, None, f'Guest added to event {event_id}')
+            db.session.commit()
             
             flash(f'Guest "{guest.full_name}" added successfully!', 'success')
             return redirect(url_for('manage_guests', event_id=event_id))
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f'Add guest error: {e}')
+            logger.error('Add guest error: %s', e)
             flash('An error occurred while adding guest!', 'error')
             return redirect(url_for('manage_guests', event_id=event_id))
 
 
+    GUEST_IMPORT_MAX_ROWS = 1000
+    GUEST_IMPORT_MAX_BYTES = 1024 * 1024
+    
+    @app.route('/client/event/<int:event_id>/guests/bulk', methods=['POST'])
+    @login_required
+    def import_guests(event_id):
+        """Import guests from an uploaded CSV file"""
+        event = Event.query.get_or_404(event_id)
+        
+        # Check authorization
+        if event.user_id != current_user.id:
+            flash('You do not have permission to add guests!', 'error')
+            return redirect(url_for('home'))
+        
+        upload = request.files.get('guests_csv')
+        if not upload or not upload.filename:
+            flash('Please choose a CSV file to import!', 'error')
+            return redirect(url_for('manage_guests', event_id=event_id))
+        
+        # Read one byte past the limit to tell a full-size file from an oversized one
+        data = upload.read(GUEST_IMPORT_MAX_BYTES + 1)
+        if len(data) > GUEST_IMPORT_MAX_BYTES:
+            flash(f'The file is too large (limit {GUEST_IMPORT_MAX_BYTES // 1024} KB)!', 'error')
+            return redirect(url_for('manage_guests', event_id=event_id))
+        
+        try:
+            reader = csv.DictReader(io.StringIO(data.decode('utf-8-sig')))
+            rows = []
+            for count, row in enumerate(reader, 1):
+                if count > GUEST_IMPORT_MAX_ROWS:
+                    flash(f'Too many guests in one file (limit {GUEST_IMPORT_MAX_ROWS} rows)!', 'error')
+                    return redirect(url_for('manage_guests', event_id=event_id))
+                first_name = (row.get('first_name') or '').strip()
+                last_name = (row.get('last_name') or '').strip()
+                if not first_name or not last_name:
+                    continue
+                rows.append({
+                    'event_id': event_id,
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'email': (row.get('email') or '').strip(),
+                    'phone': (row.get('phone') or '').strip(),
+                    'special_needs': (row.get('special_needs') or '').strip(),
+                    'dietary_restrictions': []
+                })
+            
+            if not rows:
+                flash('No guests with a first and last name were found in the file!', 'error')
+                return redirect(url_for('manage_guests', event_id=event_id))
+            
+            # ORM bulk INSERT: batched executemany, no per-object unit-of-work bookkeeping
+            db.session.execute(insert(Guest), rows)
+            log_audit('CREATE', 'Guest', None, None, {'count': len(rows)},
+                    f'{len(rows)} guests imported to event {event_id}')
+            db.session.commit()
+            
+            flash(f'{len(rows)} guests imported successfully!', 'success')
+            return redirect(url_for('manage_guests', event_id=event_id))
+            
+        except UnicodeDecodeError:
+            flash('The file must be a UTF-8 encoded CSV!', 'error')
+            return redirect(url_for('manage_guests', event_id=event_id))
+            
+        except Exception as e:
+            db.session.rollback()
+            logger.error('Import guests error: %s', e)
+            flash('An error occurred while importing guests!', 'error')
+            return redirect(url_for('manage_guests', event_id=event_id))
+
+
     @app.route('/client/event/<int:event_id>/guest/<int:guest_id>/delete', methods=['POST'])
     @login_required
     def delete_guest(event_id, guest_id):
@@ -599,16 +1004,15 @@ def create_app() -> Flask:
         try:
             guest_name = guest.full_name
             db.session.delete(guest)
-            db.session.commit()
-            
             log_audit('DELETE', 'Guest', guest_id, None, None, f'Guest deleted from event {event_id}')
+            db.session.commit()
             
             flash(f'Guest "{guest_name}" deleted successfully!', 'success')
             return redirect(url_for('manage_guests', event_id=event_id))
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f'Delete guest error: {e}')
+            logger.error('Delete guest error: %s', e)
             flash('An error occurred while deleting guest!', 'error')
             return redirect(url_for('manage_guests', event_id=event_id))
 
@@ -623,17 +1027,16 @@ def create_app() -> Flask:
         event = Event.query.get_or_404(event_id)
         
         # Check authorization
-        if event.user_id != current_user.id and not current_user.is_admin():
+        if event.user_id != current_user.id and not current_user.is_admin:
             flash('You do not have permission to view vendors!', 'error')
             return redirect(url_for('home'))
         
         event_vendors = EventVendor.query.filter_by(event_id=event_id).all()
-        available_vendors = Vendor.query.filter_by(is_available=True).all()
         
         return render_template('client/manage_vendors.html',
                             event=event,
                             event_vendors=event_vendors,
-                            available_vendors=available_vendors)
+                            available_vendors=available_vendors())
 
 
     @app.route('/client/event/<int:event_id>/vendor/add', methods=['POST'])
@@ -660,12 +1063,6 @@ def create_app() -> Flask:
                 flash('Quantity must be positive!', 'error')
                 return redirect(url_for('manage_vendors', event_id=event_id))
             
-            # Check if vendor already added
-            existing = EventVendor.query.filter_by(event_id=event_id, vendor_id=vendor_id).first()
-            if existing:
-                flash('This vendor is already added to the event!', 'error')
-                return redirect(url_for('manage_vendors', event_id=event_id))
-            
             event_vendor = EventVendor(
                 event_id=event_id,
                 vendor_id=vendor_id,
@@ -675,18 +1072,24 @@ def create_app() -> Flask:
             )
             
             db.session.add(event_vendor)
-            event.calculate_total_cost()
-            db.session.commit()
+            Event.recompute_total_cost(event_id)
             
             log_audit('CREATE', 'EventVendor', event_vendor.id, None, None, 
                     f'Vendor {vendor.name} added to event {event_id}')
+            db.session.commit()
             
             flash(f'Vendor "{vendor.name}" added successfully!', 'success')
             return redirect(url_for('manage_vendors', event_id=event_id))
             
+        except IntegrityError:
+            # Unique (event_id, vendor_id) index rejects duplicates
+            db.session.rollback()
+            flash('This vendor is already added to the event!', 'error')
+            return redirect(url_for('manage_vendors', event_id=event_id))
+            
         except Exception as e:
             db.session.rollback()
-            logger.error(f'Add vendor error: {e}')
+            logger.error('Add vendor error: %s', e)
             flash('An error occurred while adding vendor!', 'error')
             return redirect(url_for('manage_vendors', event_id=event_id))
 
@@ -706,18 +1109,17 @@ def create_app() -> Flask:
         try:
             vendor_name = event_vendor.vendor.name
             db.session.delete(event_vendor)
-            event.calculate_total_cost()
-            db.session.commit()
-            
+            Event.recompute_total_cost(event_id)
             log_audit('DELETE', 'EventVendor', event_vendor.id, None, None,
                     f'Vendor removed from event {event_id}')
+            db.session.commit()
             
             flash(f'Vendor "{vendor_name}" removed successfully!', 'success')
             return redirect(url_for('manage_vendors', event_id=event_id))
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f'Remove vendor error: {e}')
+            logger.error('Remove vendor error: %s', e)
             flash('An error occurred while removing vendor!', 'error')
             return redirect(url_for('manage_vendors', event_id=event_id))
 
@@ -729,16 +1131,22 @@ def create_app() -> Flask:
     @login_required
     def view_payment(event_id):
         """View payment details for event"""
-        event = Event.query.get_or_404(event_id)
+        event = Event.query.options(selectinload(Event.guests)).filter_by(id=event_id).first_or_404()
         
         # Check authorization
-        if event.user_id != current_user.id and not current_user.is_admin():
+        if event.user_id != current_user.id and not current_user.is_admin:
             flash('You do not have permission to view payment!', 'error')
             return redirect(url_for('home'))
         
-        total_paid = event.get_total_paid()
-        remaining = event.get_remaining_amount()
-        payments = Payment.query.filter_by(event_id=event_id).order_by(Payment.created_at.desc()).all()
+        # Plain rows: the page only reads a few fields, so skip ORM hydration
+        payments = db.session.execute(
+            select(Payment.id, Payment.amount, Payment.payment_method, Payment.status,
+                   Payment.payment_date, Payment.transaction_id, Payment.receipt_number)
+            .where(Payment.event_id == event_id)
+            .order_by(Payment.created_at.desc())
+        ).all()
+        total_paid = sum(p.amount for p in payments if p.status == PaymentStatus.PAID)
+        remaining = max(0, (event.total_cost or 0) - total_paid)
         
         return render_template('client/payment.html',
                             event=event,
@@ -758,8 +1166,13 @@ def create_app() -> Flask:
             flash('You do not have permission to make payment!', 'error')
             return redirect(url_for('home'))
         
+        raw_amount = request.form.get('amount', '0').strip()
+        if not _AMOUNT_RE.fullmatch(raw_amount):
+            flash('Please enter a valid payment amount!', 'error')
+            return redirect(url_for('view_payment', event_id=event_id))
+        
         try:
-            amount = float(request.form.get('amount', 0))
+            amount = float(raw_amount)
             payment_method = request.form.get('payment_method', '')
             
             if amount <= 0:
@@ -772,6 +1185,8 @@ def create_app() -> Flask:
                 return redirect(url_for('view_payment', event_id=event_id))
             
             # Create payment record (mock payment processing)
+            # A random reference cannot collide the way per-second timestamps did
+            reference = uuid4().hex.upper()
             payment = Payment(
                 event_id=event_id,
                 user_id=current_user.id,
@@ -779,23 +1194,26 @@ def create_app() -> Flask:
                 payment_method=payment_method,
                 status=PaymentStatus.PAID,
                 payment_date=datetime.utcnow(),
-                transaction_id=f"TXN{int(datetime.utcnow().timestamp())}",
-                receipt_number=f"RCP{int(datetime.utcnow().timestamp())}"
+                transaction_id=f"TXN{reference}",
+                receipt_number=f"RCP{reference}",
+                billing_profile=BillingProfile.for_user(current_user)
             )
             
             db.session.add(payment)
-            db.session.commit()
+            db.session.flush()
             
             log_audit('CREATE', 'Payment', payment.id, None, 
                     {'amount': amount, 'method': payment_method}, 
                     f'Payment made for event {event_id}')
+            db.session.commit()
+            cache.delete_memoized(dashboard_stats)
             
             flash(f'Payment of ₹{amount:.2f} recorded successfully!', 'success')
             return redirect(url_for('view_payment', event_id=event_id))
             
-        except Exception as e:
+        except SQLAlchemyError as e:
             db.session.rollback()
-            logger.error(f'Payment error: {e}')
+            logger.error('Payment error: %s', e)
             flash('An error occurred while processing payment!', 'error')
             return redirect(url_for('view_payment', event_id=event_id))
 
@@ -808,28 +1226,13 @@ def create_app() -> Flask:
     @admin_required
     def admin_dashboard():
         """Admin dashboard"""
-        # Statistics
-        total_users = User.query.filter_by(role=UserRole.CLIENT).count()
-        total_events = Event.query.count()
-        pending_events = Event.query.filter_by(status=EventStatus.PENDING).count()
-        total_revenue = sum(p.amount for p in Payment.query.filter_by(status=PaymentStatus.PAID).all())
-        
         # Recent events
-        recent_events = Event.query.order_by(Event.created_at.desc()).limit(10).all()
-        
-        # Events by status
-        status_breakdown = {}
-        for status in EventStatus:
-            count = Event.query.filter_by(status=status).count()
-            status_breakdown[status.value] = count
+        recent_events = Event.query.options(selectinload(Event.client)) \
+            .order_by(Event.created_at.desc()).limit(10).all()
         
         return render_template('admin/dashboard.html',
-                            total_users=total_users,
-                            total_events=total_events,
-                            pending_events=pending_events,
-                            total_revenue=total_revenue,
                             recent_events=recent_events,
-                            status_breakdown=status_breakdown)
+                            **dashboard_stats())
 
 
     @app.route('/admin/events')
@@ -837,14 +1240,17 @@ def create_app() -> Flask:
     @admin_required
     def admin_events():
         """Manage all events"""
-        page = request.args.get('page', 1, type=int)
+        cursor = request.args.get('cursor')
         status_filter = request.args.get('status', '')
         
-        query = Event.query
+        query = Event.query.options(selectinload(Event.client))
         if status_filter:
-            query = query.filter_by(status=EventStatus[status_filter])
+            try:
+                query = query.filter_by(status=_EVENT_STATUS_BY_NAME[status_filter])
+            except KeyError:
+                abort(400)
         
-        events = query.order_by(Event.created_at.desc()).paginate(page=page, per_page=20)
+        events = paginate_keyset(query, Event, cursor)
         
         return render_template('admin/events.html',
                             events=events,
@@ -857,8 +1263,21 @@ def create_app() -> Flask:
     @admin_required
     def admin_view_event(event_id):
         """View event details as admin"""
-        event = Event.query.get_or_404(event_id)
-        return render_template('admin/view_event.html', event=event)
+        # Event and its paid total in one round trip
+        row = db.session.execute(
+            Event.select_with_total_paid()
+            .options(selectinload(Event.client), selectinload(Event.venue), selectinload(Event.package),
+                     selectinload(Event.guests), undefer_group('details'))
+            .where(Event.id == event_id)
+        ).first()
+        if row is None:
+            abort(404)
+        
+        event, total_paid = row
+        return render_template('admin/view_event.html',
+                            event=event,
+                            total_paid=total_paid,
+                            remaining=max(0, (event.total_cost or 0) - total_paid))
 
 
     @app.route('/admin/event/<int:event_id>/status', methods=['POST'])
@@ -872,30 +1291,31 @@ def create_app() -> Flask:
             new_status = request.form.get('status', '')
             admin_notes = request.form.get('admin_notes', '').strip()
             
-            if new_status not in [s.name for s in EventStatus]:
+            status = _EVENT_STATUS_BY_NAME.get(new_status)
+            if status is None:
                 flash('Invalid status!', 'error')
                 return redirect(url_for('admin_view_event', event_id=event_id))
             
             old_status = event.status.value
-            event.status = EventStatus[new_status]
+            event.status = status
             event.admin_notes = admin_notes
             
             if new_status == 'APPROVED':
                 event.approval_date = datetime.utcnow()
             
-            db.session.commit()
-            
             log_audit('UPDATE', 'Event', event_id,
                     {'status': old_status},
                     {'status': new_status},
                     f'Event status updated to {new_status}')
+            db.session.commit()
+            cache.delete_memoized(dashboard_stats)
             
             flash(f'Event status updated to {new_status}!', 'success')
             return redirect(url_for('admin_view_event', event_id=event_id))
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f'Status update error: {e}')
+            logger.error('Status update error: %s', e)
             flash('An error occurred while updating status!', 'error')
             return redirect(url_for('admin_view_event', event_id=event_id))
 
@@ -905,14 +1325,17 @@ def create_app() -> Flask:
     @admin_required
     def admin_users():
         """Manage all users"""
-        page = request.args.get('page', 1, type=int)
+        cursor = request.args.get('cursor')
         role_filter = request.args.get('role', '')
         
         query = User.query
         if role_filter:
-            query = query.filter_by(role=UserRole[role_filter])
+            try:
+                query = query.filter_by(role=_USER_ROLE_BY_NAME[role_filter])
+            except KeyError:
+                abort(400)
         
-        users = query.order_by(User.created_at.desc()).paginate(page=page, per_page=20)
+        users = paginate_keyset(query, User, cursor)
         
         return render_template('admin/users.html',
                             users=users,
@@ -933,20 +1356,22 @@ def create_app() -> Flask:
         
         try:
             user.is_active = not user.is_active
-            db.session.commit()
             
             status = 'activated' if user.is_active else 'deactivated'
             log_audit('UPDATE', 'User', user_id,
                     {'is_active': not user.is_active},
                     {'is_active': user.is_active},
                     f'User {status}')
+            db.session.commit()
+            cache.delete_memoized(cached_user, user_id)
+            cache.delete_memoized(dashboard_stats)
             
             flash(f'User {user.username} {status} successfully!', 'success')
             return redirect(url_for('admin_users'))
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f'Toggle user error: {e}')
+            logger.error('Toggle user error: %s', e)
             flash('An error occurred!', 'error')
             return redirect(url_for('admin_users'))
 
@@ -956,8 +1381,7 @@ def create_app() -> Flask:
     @admin_required
     def admin_venues():
         """Manage venues"""
-        page = request.args.get('page', 1, type=int)
-        venues = Venue.query.order_by(Venue.created_at.desc()).paginate(page=page, per_page=20)
+        venues = paginate_keyset(Venue.query, Venue, request.args.get('cursor'))
         return render_template('admin/venues.html', venues=venues)
 
 
@@ -966,8 +1390,7 @@ def create_app() -> Flask:
     @admin_required
     def admin_vendors():
         """Manage vendors"""
-        page = request.args.get('page', 1, type=int)
-        vendors = Vendor.query.order_by(Vendor.created_at.desc()).paginate(page=page, per_page=20)
+        vendors = paginate_keyset(Vendor.query, Vendor, request.args.get('cursor'))
         return render_template('admin/vendors.html', vendors=vendors)
 
 
@@ -976,8 +1399,7 @@ def create_app() -> Flask:
     @admin_required
     def admin_packages():
         """Manage packages"""
-        page = request.args.get('page', 1, type=int)
-        packages = Package.query.order_by(Package.created_at.desc()).paginate(page=page, per_page=20)
+        packages = paginate_keyset(Package.query, Package, request.args.get('cursor'))
         return render_template('admin/packages.html', packages=packages)
 
 
@@ -992,34 +1414,25 @@ def create_app() -> Flask:
             max_capacity = request.args.get('max_capacity', 10000, type=int)
             city = request.args.get('city', '')
             
-            query = Venue.query.filter(
+            query = select(
+                Venue.id, Venue.name, Venue.capacity, Venue.location, Venue.base_rent, Venue.rating
+            ).where(
                 Venue.is_available == True,
-                Venue.capacity >= min_capacity,
-                Venue.capacity <= max_capacity
+                Venue.capacity.between(min_capacity, max_capacity)
             )
             
             if city:
-                query = query.filter_by(city=city)
+                query = query.where(Venue.city == city)
             
-            venues = query.all()
+            venues = db.session.execute(query).mappings()
             
             return jsonify({
                 'success': True,
-                'venues': [
-                    {
-                        'id': v.id,
-                        'name': v.name,
-                        'capacity': v.capacity,
-                        'location': v.location,
-                        'base_rent': v.base_rent,
-                        'rating': v.rating
-                    }
-                    for v in venues
-                ]
+                'venues': [dict(v) for v in venues]
             })
             
         except Exception as e:
-            logger.error(f'API filter venues error: {e}')
+            logger.error('API filter venues error: %s', e)
             return jsonify({'success': False, 'error': str(e)}), 400
 
 
@@ -1027,24 +1440,17 @@ def create_app() -> Flask:
     def api_get_package(package_id):
         """Get package details"""
         try:
-            package = Package.query.get_or_404(package_id)
+            version = db.session.query(Package.updated_at).filter_by(id=package_id).first()
+            if version is None:
+                return jsonify({'success': False, 'error': 'Package not found'}), 404
             
-            return jsonify({
-                'success': True,
-                'package': {
-                    'id': package.id,
-                    'name': package.name,
-                    'description': package.description,
-                    'base_price': package.base_price,
-                    'price_per_guest': package.price_per_guest,
-                    'max_guests': package.max_guests,
-                    'features': package.features,
-                    'services_included': package.services_included
-                }
-            })
+            body, etag = package_json(package_id, version.updated_at)
+            response = app.response_class(body, mimetype='application/json')
+            response.set_etag(etag)
+            return response.make_conditional(request)
             
         except Exception as e:
-            logger.error(f'API get package error: {e}')
+            logger.error('API get package error: %s', e)
             return jsonify({'success': False, 'error': str(e)}), 400
 
 
@@ -1054,10 +1460,16 @@ def create_app() -> Flask:
     def init_database():
         """Initialize database with default data"""
         with app.app_context():
-            db.create_all()
+            if inspect(db.engine).has_table('users'):
+                # Existing database: apply pending migrations (pre-migration ones start at the baseline)
+                upgrade()
+            else:
+                # New database: build the current schema directly and mark it up to date
+                db.create_all()
+                stamp()
             
             # Check if data already exists
-            if User.query.filter_by(username='Admin').first():
+            if db.session.query(exists().where(User.username == 'Admin')).scalar():
                 return
             
             print("Initializing database with default data...")
@@ -1066,7 +1478,7 @@ def create_app() -> Flask:
             admin = User(
                 username='Admin',
                 email='admin@eventmanagement.com',
-                password=generate_password_hash('Admin@123'),
+                password=DEFAULT_ADMIN_PASSWORD_HASH,
                 first_name='Admin',
                 role=UserRole.ADMIN,
                 is_active=True
@@ -1117,9 +1529,8 @@ def create_app() -> Flask:
                 }
             ]
             
-            for venue_data in venues_data:
-                venue = Venue(**venue_data)
-                db.session.add(venue)
+            # Core executemany: one INSERT statement per table, inside the seed transaction
+            db.session.execute(Venue.__table__.insert(), venues_data)
             
             # Create sample packages
             packages_data = [
@@ -1152,9 +1563,7 @@ def create_app() -> Flask:
                 }
             ]
             
-            for pkg_data in packages_data:
-                package = Package(**pkg_data)
-                db.session.add(package)
+            db.session.execute(Package.__table__.insert(), packages_data)
             
             # sample vendors
             vendors_data = [
@@ -1190,9 +1599,10 @@ def create_app() -> Flask:
                 }
             ]
             
-            for vendor_data in vendors_data:
-                vendor = Vendor(**vendor_data)
-                db.session.add(vendor)
+            # executemany needs the same keys in every row
+            vendor_keys = set().union(*vendors_data)
+            db.session.execute(Vendor.__table__.insert(),
+                               [{key: vendor.get(key) for key in vendor_keys} for vendor in vendors_data])
             
             db.session.commit()
             print("✓ Database initialized successfully!")
@@ -1206,4 +1616,5 @@ def create_app() -> Flask:
 # ============================================
 if __name__ == '__main__':
     app = create_app()
+    app.jinja_env.auto_reload = True  # Pick up template edits in the dev server
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,38 @@
+# gunicorn.conf.py - Production WSGI server settings
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Cooperative gevent workers only pay off with a network database. sqlite3 waits on
+# a locked file inside C, which would stall every greenlet in the worker, so SQLite
+# gets threaded workers instead.
+uses_sqlite = os.environ.get('DATABASE_URL', 'sqlite:///events.db').startswith('sqlite')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread' if uses_sqlite else 'gevent')
+threads = int(os.environ.get('GUNICORN_THREADS', 4))  # gthread only
+worker_connections = 1000  # gevent only
+
+if worker_class == 'gevent':
+    # preload_app imports the app and database driver in the master, before the
+    # gevent worker would patch the stdlib; patch first so they see the patched modules
+    from gevent import monkey
+    monkey.patch_all()
+
+keepalive = 5
+timeout = 30
+
+# Cache invalidations must reach every worker; the default SimpleCache is per-process
+os.environ.setdefault('CACHE_TYPE', 'FileSystemCache')
+
+# Create the app (and seed the database) once in the master, not per worker
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the master process"""
+    from models import db
+    from wsgi import app
+
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -1,7 +1,7 @@
-from app import app, db
-from models import Venue, Package, User
-from werkzeug.security import generate_password_hash
-import json
+from app import create_app, DEFAULT_ADMIN_PASSWORD_HASH
+from models import db, Venue, Package, User
+
+app = create_app()
 
 def init_db():
     with app.app_context():
@@ -17,13 +17,13 @@ def init_db():
                 "location": "Pune West",
                 "capacity": 50,
                 "rent": 25000,
-                "facilities": json.dumps([
+                "facilities": [
                     "Parking",
                     "Air Conditioning",
                     "Basic Sound System",
                     "Garden Area",
                     "Changing Rooms"
-                ]),
+                ],
                 "description": "Perfect for intimate gatherings with a beautiful garden setting"
             },
             {
@@ -31,12 +31,12 @@ def init_db():
                 "location": "Pune East",
                 "capacity": 50,
                 "rent": 20000,
-                "facilities": json.dumps([
+                "facilities": [
                     "Parking",
                     "Air Conditioning",
                     "Kitchen Area",
                     "Basic Decoration"
-                ]),
+                ],
                 "description": "Traditional venue ideal for small functions and gatherings"
             },
             {
@@ -44,14 +44,14 @@ def init_db():
                 "location": "Pune Central",
                 "capacity": 100,
                 "rent": 45000,
-                "facilities": json.dumps([
+                "facilities": [
                     "Valet Parking",
                     "Central AC",
                     "Premium Sound System",
                     "Stage",
                     "Green Room",
                     "Kitchen"
-                ]),
+                ],
                 "description": "Royal ambiance with modern amenities"
             },
             {
@@ -59,13 +59,13 @@ def init_db():
                 "location": "Pune North",
                 "capacity": 100,
                 "rent": 40000,
-                "facilities": json.dumps([
+                "facilities": [
                     "Large Parking",
                     "Air Conditioning",
                     "Professional Sound System",
                     "Projector",
                     "Dining Area"
-                ]),
+                ],
                 "description": "Perfect blend of elegance and functionality"
             },
             {
@@ -73,14 +73,14 @@ def init_db():
                 "location": "Pune South",
                 "capacity": 150,
                 "rent": 60000,
-                "facilities": json.dumps([
+                "facilities": [
                     "Multilevel Parking",
                     "Central AC",
                     "Premium Audio System",
                     "Banquet Hall",
                     "Bride Room",
                     "Groom Room"
-                ]),
+                ],
                 "description": "Luxurious venue with traditional touch"
             },
             {
@@ -88,13 +88,13 @@ def init_db():
                 "location": "Pune Central",
                 "capacity": 150,
                 "rent": 55000,
-                "facilities": json.dumps([
+                "facilities": [
                     "Spacious Parking",
                     "Air Conditioning",
                     "DJ Setup",
                     "Stage",
                     "Dining Hall"
-                ]),
+                ],
                 "description": "Modern amenities with traditional architecture"
             },
             {
@@ -102,7 +102,7 @@ def init_db():
                 "location": "Pune West",
                 "capacity": 200,
                 "rent": 85000,
-                "facilities": json.dumps([
+                "facilities": [
                     "Multilevel Parking",
                     "Central AC",
                     "Premium Sound & Lighting",
@@ -110,7 +110,7 @@ def init_db():
                     "VIP Lounge",
                     "Bridal Suite",
                     "Kitchen"
-                ]),
+                ],
                 "description": "Luxurious space perfect for grand celebrations"
             },
             {
@@ -118,14 +118,14 @@ def init_db():
                 "location": "Pune East",
                 "capacity": 200,
                 "rent": 80000,
-                "facilities": json.dumps([
+                "facilities": [
                     "Valet Parking",
                     "Central AC",
                     "Professional AV System",
                     "Grand Ballroom",
                     "Outdoor Garden",
                     "Changing Rooms"
-                ]),
+                ],
                 "description": "Magnificent venue for memorable events"
             }
         ]
@@ -138,23 +138,23 @@ def init_db():
                 "description": "Essential services for your event",
                 "price": 35000,
                 "price_per_guest": 150,
-                "features": json.dumps([
+                "features": [
                     "Basic Decoration",
                     "Standard Menu (10 items)",
                     "Basic Sound System",
                     "4 Hours Duration",
                     "Basic Photography",
                     "Welcome Drinks"
-                ]),
+                ],
                 "decoration_type": "Basic",
                 "menu_type": "Standard",
-                "services_included": json.dumps([
+                "services_included": [
                     "Basic Lighting",
                     "Standard Seating",
                     "Basic Stage Setup",
                     "Service Staff",
                     "Clean-up Service"
-                ]),
+                ],
                 "max_guests": 100,
                 "duration_hours": 4,
                 "setup_time": 2,
@@ -167,7 +167,7 @@ def init_db():
                 "description": "Enhanced services for a memorable celebration",
                 "price": 75000,
                 "price_per_guest": 250,
-                "features": json.dumps([
+                "features": [
                     "Premium Decoration",
                     "Deluxe Menu (15 items)",
                     "Professional Sound System",
@@ -176,17 +176,17 @@ def init_db():
                     "Video Coverage",
                     "DJ Services",
                     "Welcome Drinks & Snacks"
-                ]),
+                ],
                 "decoration_type": "Premium",
                 "menu_type": "Deluxe",
-                "services_included": json.dumps([
+                "services_included": [
                     "Theme Lighting",
                     "Premium Seating",
                     "Designer Stage",
                     "MC/Host",
                     "Valet Parking",
                     "Dedicated Event Coordinator"
-                ]),
+                ],
                 "max_guests": 150,
                 "duration_hours": 6,
                 "setup_time": 3,
@@ -199,7 +199,7 @@ def init_db():
                 "description": "Luxury services for a grand celebration",
                 "price": 150000,
                 "price_per_guest": 500,
-                "features": json.dumps([
+                "features": [
                     "Luxury Decoration",
                     "Gourmet Menu (20 items)",
                     "Premium Sound & Lighting System",
@@ -209,10 +209,10 @@ def init_db():
                     "360° Photo Booth",
                     "Live Band",
                     "Fireworks Display"
-                ]),
+                ],
                 "decoration_type": "Luxury",
                 "menu_type": "Gourmet",
-                "services_included": json.dumps([
+                "services_included": [
                     "Custom Theme Design",
                     "Premium Bar Setup",
                     "VIP Seating",
@@ -222,7 +222,7 @@ def init_db():
                     "Valet Parking",
                     "Red Carpet Welcome",
                     "Celebrity Event Planner"
-                ]),
+                ],
                 "max_guests": 200,
                 "duration_hours": 8,
                 "setup_time": 4,
@@ -231,48 +231,56 @@ def init_db():
             }
         ]
 
+        # Look up existing names once instead of once per row
+        existing_venues = {name for (name,) in db.session.query(Venue.name).filter(
+            Venue.name.in_([v['name'] for v in venues]))}
+        existing_packages = {name for (name,) in db.session.query(Package.name).filter(
+            Package.name.in_([p['name'] for p in packages]))}
+
         # Add venues if they don't exist (map legacy keys to model fields)
+        new_venues = []
         for venue_data in venues:
-            if not Venue.query.filter_by(name=venue_data['name']).first():
-                v = {
+            if venue_data['name'] not in existing_venues:
+                new_venues.append({
                     'name': venue_data.get('name'),
                     'location': venue_data.get('location'),
                     'capacity': venue_data.get('capacity'),
                     'base_rent': venue_data.get('rent') or venue_data.get('base_rent'),
                     'description': venue_data.get('description'),
-                    'facilities': json.loads(venue_data['facilities']) if isinstance(venue_data.get('facilities'), str) else venue_data.get('facilities') or [],
-                }
-                venue = Venue(**v)
-                db.session.add(venue)
+                    'facilities': venue_data.get('facilities', []),
+                })
+        if new_venues:
+            db.session.execute(Venue.__table__.insert(), new_venues)
 
         # Add packages if they don't exist (map legacy keys)
+        new_packages = []
         for package_data in packages:
-            if not Package.query.filter_by(name=package_data['name']).first():
-                p = {
+            if package_data['name'] not in existing_packages:
+                new_packages.append({
                     'name': package_data.get('name'),
                     'package_type': package_data.get('type') or package_data.get('package_type'),
                     'description': package_data.get('description'),
                     'base_price': package_data.get('price') or package_data.get('base_price') or 0,
                     'price_per_guest': package_data.get('price_per_guest') or package_data.get('price_per_guest') or 0,
-                    'features': json.loads(package_data['features']) if isinstance(package_data.get('features'), str) else package_data.get('features') or [],
+                    'features': package_data.get('features', []),
                     'decoration_type': package_data.get('decoration_type'),
                     'menu_type': package_data.get('menu_type'),
-                    'services_included': json.loads(package_data['services_included']) if isinstance(package_data.get('services_included'), str) else package_data.get('services_included') or [],
+                    'services_included': package_data.get('services_included', []),
                     'max_guests': package_data.get('max_guests'),
                     'duration_hours': package_data.get('duration_hours'),
                     'setup_time': package_data.get('setup_time'),
                     'cleanup_time': package_data.get('cleanup_time'),
                     'cancellation_policy': package_data.get('cancellation_policy')
-                }
-                package = Package(**p)
-                db.session.add(package)
+                })
+        if new_packages:
+            db.session.execute(Package.__table__.insert(), new_packages)
 
         # Add admin user
         if not User.query.filter_by(username='Admin').first():
             admin = User(
                 username='Admin',
                 email='admin@eventmanagement.com',
-                password=generate_password_hash('Admin@123')
+                password=DEFAULT_ADMIN_PASSWORD_HASH
             )
             db.session.add(admin)
 
@@ -0,0 +1,28 @@
+"""Baseline schema
+
+The tables as db.create_all() built them before migrations were added.
+Databases created back then have no alembic_version table; init_database
+upgrades them from here.
+
+Revision ID: 3f1c2a9d7b10
+Revises: 
+Create Date: 2026-10-15 08:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9d7b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    pass
+
+
+def downgrade():
+    pass
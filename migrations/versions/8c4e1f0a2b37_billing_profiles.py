@@ -0,0 +1,115 @@
+"""Move payment billing details to billing_profiles
+
+Revision ID: 8c4e1f0a2b37
+Revises: 3f1c2a9d7b10
+Create Date: 2026-10-15 08:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4e1f0a2b37'
+down_revision = '3f1c2a9d7b10'
+branch_labels = None
+depends_on = None
+
+BILLING_COLUMNS = [
+    # (payments column, billing_profiles column)
+    ('billing_name', 'name'),
+    ('billing_email', 'email'),
+    ('billing_phone', 'phone'),
+    ('billing_address', 'address'),
+    ('gst_number', 'gst_number'),
+]
+
+payments = sa.table(
+    'payments',
+    sa.column('id', sa.Integer),
+    sa.column('user_id', sa.Integer),
+    sa.column('billing_profile_id', sa.Integer),
+    sa.column('created_at', sa.DateTime),
+    *(sa.column(old, sa.Text) for old, _ in BILLING_COLUMNS),
+)
+billing_profiles = sa.table(
+    'billing_profiles',
+    sa.column('id', sa.Integer),
+    sa.column('user_id', sa.Integer),
+    sa.column('created_at', sa.DateTime),
+    sa.column('updated_at', sa.DateTime),
+    *(sa.column(new, sa.Text) for _, new in BILLING_COLUMNS),
+)
+
+
+def _same_billing():
+    """Correlates a payment with the profile holding exactly its billing values"""
+    return sa.and_(
+        billing_profiles.c.user_id == payments.c.user_id,
+        *(billing_profiles.c[new].is_not_distinct_from(payments.c[old]) for old, new in BILLING_COLUMNS),
+    )
+
+
+def upgrade():
+    op.create_table(
+        'billing_profiles',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=120), nullable=True),
+        sa.Column('email', sa.String(length=120), nullable=True),
+        sa.Column('phone', sa.String(length=20), nullable=True),
+        sa.Column('address', sa.Text(), nullable=True),
+        sa.Column('gst_number', sa.String(length=20), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_billing_profiles_user_id', 'billing_profiles', ['user_id'])
+    
+    with op.batch_alter_table('payments') as batch_op:
+        batch_op.add_column(sa.Column('billing_profile_id', sa.Integer(), nullable=True))
+        batch_op.create_index('ix_payments_billing_profile_id', ['billing_profile_id'])
+        batch_op.create_foreign_key('fk_payments_billing_profile_id', 'billing_profiles',
+                                    ['billing_profile_id'], ['id'])
+    
+    # One profile per distinct set of billing details a user has paid with
+    billed = sa.or_(*(payments.c[old].is_not(None) for old, _ in BILLING_COLUMNS))
+    group = [payments.c.user_id, *(payments.c[old] for old, _ in BILLING_COLUMNS)]
+    op.execute(billing_profiles.insert().from_select(
+        ['user_id', *(new for _, new in BILLING_COLUMNS), 'created_at', 'updated_at'],
+        sa.select(*group, sa.func.min(payments.c.created_at), sa.func.max(payments.c.created_at))
+        .where(billed)
+        .group_by(*group),
+    ))
+    op.execute(payments.update().where(billed).values(
+        billing_profile_id=sa.select(billing_profiles.c.id).where(_same_billing()).scalar_subquery()
+    ))
+    
+    with op.batch_alter_table('payments') as batch_op:
+        for old, _ in BILLING_COLUMNS:
+            batch_op.drop_column(old)
+
+
+def downgrade():
+    with op.batch_alter_table('payments') as batch_op:
+        batch_op.add_column(sa.Column('billing_name', sa.String(length=120), nullable=True))
+        batch_op.add_column(sa.Column('billing_email', sa.String(length=120), nullable=True))
+        batch_op.add_column(sa.Column('billing_phone', sa.String(length=20), nullable=True))
+        batch_op.add_column(sa.Column('billing_address', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('gst_number', sa.String(length=20), nullable=True))
+    
+    op.execute(payments.update().where(payments.c.billing_profile_id.is_not(None)).values({
+        payments.c[old]: sa.select(billing_profiles.c[new])
+        .where(billing_profiles.c.id == payments.c.billing_profile_id)
+        .scalar_subquery()
+        for old, new in BILLING_COLUMNS
+    }))
+    
+    with op.batch_alter_table('payments') as batch_op:
+        batch_op.drop_constraint('fk_payments_billing_profile_id', type_='foreignkey')
+        batch_op.drop_index('ix_payments_billing_profile_id')
+        batch_op.drop_column('billing_profile_id')
+    
+    op.drop_index('ix_billing_profiles_user_id', table_name='billing_profiles')
+    op.drop_table('billing_profiles')
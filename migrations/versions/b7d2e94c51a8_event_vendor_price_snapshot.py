@@ -0,0 +1,50 @@
+"""Snapshot the vendor price on event_vendors and store the line total
+
+Revision ID: b7d2e94c51a8
+Revises: 8c4e1f0a2b37
+Create Date: 2026-10-15 08:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2e94c51a8'
+down_revision = '8c4e1f0a2b37'
+branch_labels = None
+depends_on = None
+
+event_vendors = sa.table(
+    'event_vendors',
+    sa.column('vendor_id', sa.Integer),
+    sa.column('vendor_price_snapshot', sa.Float),
+)
+vendors = sa.table(
+    'vendors',
+    sa.column('id', sa.Integer),
+    sa.column('base_price', sa.Float),
+)
+
+
+def upgrade():
+    with op.batch_alter_table('event_vendors') as batch_op:
+        batch_op.add_column(sa.Column('vendor_price_snapshot', sa.Float(), nullable=True))
+    
+    # Existing bookings keep the vendor's price as of this upgrade
+    op.execute(event_vendors.update().values(vendor_price_snapshot=sa.func.coalesce(
+        sa.select(vendors.c.base_price).where(vendors.c.id == event_vendors.c.vendor_id).scalar_subquery(),
+        0,
+    )))
+    
+    # SQLite cannot ALTER in a NOT NULL or a stored generated column, so rebuild the table there
+    with op.batch_alter_table('event_vendors', recreate='auto') as batch_op:
+        batch_op.alter_column('vendor_price_snapshot', existing_type=sa.Float(), nullable=False)
+        batch_op.add_column(sa.Column('total_cost', sa.Float(), sa.Computed(
+            'COALESCE(NULLIF(custom_price, 0), vendor_price_snapshot) * quantity', persisted=True)))
+
+
+def downgrade():
+    with op.batch_alter_table('event_vendors') as batch_op:
+        batch_op.drop_column('total_cost')
+        batch_op.drop_column('vendor_price_snapshot')
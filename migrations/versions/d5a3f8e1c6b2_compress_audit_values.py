@@ -0,0 +1,76 @@
+"""Store audit log value snapshots as zstd-compressed JSON
+
+Revision ID: d5a3f8e1c6b2
+Revises: b7d2e94c51a8
+Create Date: 2026-10-15 08:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import orjson
+import zstandard
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a3f8e1c6b2'
+down_revision = 'b7d2e94c51a8'
+branch_labels = None
+depends_on = None
+
+VALUE_COLUMNS = ('old_values', 'new_values')
+
+audit_logs = sa.table(
+    'audit_logs',
+    sa.column('id', sa.Integer),
+    *(sa.column(name, sa.LargeBinary) for name in VALUE_COLUMNS),
+)
+
+
+def _rewrite_values(convert, batch_size=1000):
+    """Apply convert to every stored value, reading the table in id order a batch at a time"""
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(audit_logs).where(audit_logs.c.id > last_id).order_by(audit_logs.c.id).limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        for row in rows:
+            values = {name: convert(row._mapping[name]) for name in VALUE_COLUMNS}
+            connection.execute(audit_logs.update().where(audit_logs.c.id == row.id).values(values))
+        last_id = rows[-1].id
+
+
+def _compress(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.encode()
+    return zstandard.compress(orjson.dumps(orjson.loads(value)), 3)
+
+
+def _decompress(value):
+    if value is None:
+        return None
+    value = bytes(value)
+    if value.startswith(b'\x28\xb5\x2f\xfd'):  # zstd frame magic
+        value = zstandard.decompress(value)
+    return value
+
+
+def upgrade():
+    # json/jsonb -> bytea holding the JSON text; SQLite rebuilds the table
+    with op.batch_alter_table('audit_logs') as batch_op:
+        for name in VALUE_COLUMNS:
+            batch_op.alter_column(name, existing_type=sa.JSON(), type_=sa.LargeBinary(),
+                                  postgresql_using=f"convert_to({name}::text, 'UTF8')")
+    _rewrite_values(_compress)
+
+
+def downgrade():
+    _rewrite_values(_decompress)
+    with op.batch_alter_table('audit_logs') as batch_op:
+        for name in VALUE_COLUMNS:
+            batch_op.alter_column(name, existing_type=sa.LargeBinary(), type_=sa.JSON(),
+                                  postgresql_using=f"convert_from({name}, 'UTF8')::json")
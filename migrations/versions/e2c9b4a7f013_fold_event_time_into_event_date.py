@@ -0,0 +1,55 @@
+"""Fold events.event_time into event_date
+
+Revision ID: e2c9b4a7f013
+Revises: d5a3f8e1c6b2
+Create Date: 2026-10-15 08:40:00.000000
+
+"""
+from datetime import datetime, time
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2c9b4a7f013'
+down_revision = 'd5a3f8e1c6b2'
+branch_labels = None
+depends_on = None
+
+events = sa.table(
+    'events',
+    sa.column('id', sa.Integer),
+    sa.column('event_date', sa.DateTime),
+    sa.column('event_time', sa.String),
+)
+
+
+def upgrade():
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(events.c.id, events.c.event_date, events.c.event_time)
+        .where(events.c.event_time.is_not(None), events.c.event_time != '')
+    ).all()
+    for row in rows:
+        try:
+            start = time.fromisoformat(row.event_time)
+        except ValueError:
+            continue  # Unparseable free text; keep the stored date as is
+        connection.execute(events.update().where(events.c.id == row.id).values(
+            event_date=datetime.combine(row.event_date.date(), start)))
+    
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.drop_column('event_time')
+
+
+def downgrade():
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.add_column(sa.Column('event_time', sa.String(length=5), nullable=True))
+    
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(events.c.id, events.c.event_date)).all()
+    for row in rows:
+        connection.execute(events.update().where(events.c.id == row.id).values(
+            event_date=datetime.combine(row.event_date.date(), time()),
+            event_time=row.event_date.strftime('%H:%M')))
@@ -0,0 +1,39 @@
+"""Null audit_logs.admin_id when the admin is deleted
+
+Revision ID: f4a81c3e9d25
+Revises: e2c9b4a7f013
+Create Date: 2026-10-15 08:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4a81c3e9d25'
+down_revision = 'e2c9b4a7f013'
+branch_labels = None
+depends_on = None
+
+# create_all left the SQLite constraint unnamed; name it while rebuilding the table
+SQLITE_NAMING = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+SQLITE_FK = 'fk_audit_logs_admin_id_users'
+POSTGRES_FK = 'audit_logs_admin_id_fkey'
+
+
+def _replace_admin_fk(ondelete):
+    if op.get_bind().dialect.name == 'sqlite':
+        with op.batch_alter_table('audit_logs', recreate='always', naming_convention=SQLITE_NAMING) as batch_op:
+            batch_op.drop_constraint(SQLITE_FK, type_='foreignkey')
+            batch_op.create_foreign_key(SQLITE_FK, 'users', ['admin_id'], ['id'], ondelete=ondelete)
+    else:
+        op.drop_constraint(POSTGRES_FK, 'audit_logs', type_='foreignkey')
+        op.create_foreign_key(POSTGRES_FK, 'audit_logs', 'users', ['admin_id'], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    _replace_admin_fk('SET NULL')
+
+
+def downgrade():
+    _replace_admin_fk(None)
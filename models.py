@@ -1,11 +1,69 @@
 # models.py - Production-Ready Event Management System Database Models
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import and_, func, inspect, lambda_stmt, select, text, update, event as sa_event
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import deferred
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator
 from flask_login import UserMixin
 from datetime import datetime
+from functools import cached_property
 import enum
+import orjson
+import zstandard
 
 db = SQLAlchemy()
 
+# Binary, indexable JSONB on PostgreSQL; plain JSON on other backends
+JSONType = db.JSON().with_variant(JSONB(), 'postgresql')
+
+
+class CompressedJSON(TypeDecorator):
+    """JSON stored as zstd-compressed bytes, for write-once blobs never queried by key"""
+    impl = db.LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return zstandard.compress(orjson.dumps(value), 3)
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # Rows written before compression hold plain JSON text
+        if isinstance(value, str):
+            return orjson.loads(value)
+        value = bytes(value)
+        if value.startswith(b'\x28\xb5\x2f\xfd'):  # zstd frame magic
+            value = zstandard.decompress(value)
+        return orjson.loads(value)
+
+
+def _identity(obj):
+    """Primary key from the instance state; never loads expired attributes"""
+    identity = inspect(obj).identity
+    return identity[0] if identity else None
+
+
+def flag_index(name, flag, *columns):
+    """Partial index over only the rows where a boolean flag is set"""
+    # SQLite only matches a partial index whose WHERE reads exactly like the query's
+    return db.Index(name, *columns, postgresql_where=text(flag), sqlite_where=text(f'{flag} = 1'))
+
+
+def jsonb_gin_index(name, column):
+    """GIN jsonb_path_ops index for @> containment queries (PostgreSQL only)"""
+    return db.Index(name, column, postgresql_using='gin',
+                    postgresql_ops={column: 'jsonb_path_ops'}).ddl_if(dialect='postgresql')
+
+
+def enum_type(enum_cls):
+    """Enum stored as its member name in a VARCHAR guarded by a CHECK constraint"""
+    # No native PG ENUM type: adding a status is a CHECK swap, not an ALTER TYPE
+    return db.Enum(enum_cls, native_enum=False, create_constraint=True, length=20,
+                   name=f'ck_{enum_cls.__name__.lower()}')
+
 
 class UserRole(enum.Enum):
     CLIENT = "CLIENT"
@@ -34,6 +92,9 @@ class PaymentStatus(enum.Enum):
 # ============================================
 class User(UserMixin, db.Model):
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('ix_user_role_created', 'role', 'created_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False, index=True)
@@ -50,8 +111,8 @@ class User(UserMixin, db.Model):
     profile_image = db.Column(db.String(255))
     
     # Account settings
-    role = db.Column(db.Enum(UserRole), default=UserRole.CLIENT, nullable=False)
-    is_active = db.Column(db.Boolean, default=True, index=True)
+    role = db.Column(enum_type(UserRole), default=UserRole.CLIENT, nullable=False)
+    is_active = db.Column(db.Boolean, default=True)
     email_verified = db.Column(db.Boolean, default=False)
     phone_verified = db.Column(db.Boolean, default=False)
     
@@ -61,17 +122,29 @@ class User(UserMixin, db.Model):
     last_login = db.Column(db.DateTime)
     
     # Relationships
-    events = db.relationship('Event', backref='client', lazy=True, cascade='all, delete-orphan')
-    payments = db.relationship('Payment', backref='user', lazy=True, cascade='all, delete-orphan')
+    events = db.relationship('Event', back_populates='client', lazy=True, cascade='all, delete-orphan')
+    payments = db.relationship('Payment', back_populates='user', lazy=True, cascade='all, delete-orphan')
+    billing_profiles = db.relationship('BillingProfile', back_populates='user', lazy=True, cascade='all, delete-orphan')
+    # Only written, never read through the user; raise instead of silently loading
+    audit_logs = db.relationship('AuditLog', back_populates='admin', lazy='raise', passive_deletes=True)
     
     def __repr__(self):
-        return f'<User {self.username}>'
+        return f'<User id={_identity(self)}>'
     
+    @classmethod
+    def by_username(cls, username):
+        """Login lookup; lambda_stmt reuses the compiled SELECT across requests"""
+        return db.session.execute(
+            lambda_stmt(lambda: select(User).where(User.username == username))
+        ).scalar_one_or_none()
+    
+    @cached_property
     def is_admin(self):
-        return self.role == UserRole.ADMIN
+        return self.role is UserRole.ADMIN
     
+    @cached_property
     def is_client(self):
-        return self.role == UserRole.CLIENT
+        return self.role is UserRole.CLIENT
     
     @property
     def full_name(self):
@@ -83,6 +156,13 @@ class User(UserMixin, db.Model):
 # ============================================
 class Venue(db.Model):
     __tablename__ = 'venues'
+    __table_args__ = (
+        # Equality columns first so the capacity range can use the index too
+        db.Index('ix_venue_avail_city_cap', 'is_available', 'city', 'capacity'),
+        flag_index('ix_venue_available', 'is_available', 'id'),
+        jsonb_gin_index('ix_venue_facilities_gin', 'facilities'),
+        jsonb_gin_index('ix_venue_amenities_gin', 'amenities'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(120), nullable=False, index=True)
@@ -97,8 +177,8 @@ class Venue(db.Model):
     additional_cost_per_hour = db.Column(db.Float, default=0)
     
     # Facilities and amenities
-    facilities = db.Column(db.JSON, default={})
-    amenities = db.Column(db.JSON, default={})
+    facilities = db.Column(JSONType, default={})
+    amenities = db.Column(JSONType, default={})
     
     # Rules and policies
     parking_capacity = db.Column(db.Integer, default=0)
@@ -111,8 +191,8 @@ class Venue(db.Model):
     smoking_allowed = db.Column(db.Boolean, default=False)
     
     # Operating hours
-    opening_time = db.Column(db.String(5))  # HH:MM format
-    closing_time = db.Column(db.String(5))
+    opening_time = db.Column(db.Time)
+    closing_time = db.Column(db.Time)
     
     # Contact information
     contact_person = db.Column(db.String(100))
@@ -120,22 +200,22 @@ class Venue(db.Model):
     contact_email = db.Column(db.String(120))
     
     # Media
-    images = db.Column(db.JSON, default=[])
+    images = db.Column(JSONType, default=[])
     
     # Rating and availability
     rating = db.Column(db.Float, default=0)
     reviews_count = db.Column(db.Integer, default=0)
-    is_available = db.Column(db.Boolean, default=True, index=True)
+    is_available = db.Column(db.Boolean, default=True)
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    events = db.relationship('Event', backref='venue', lazy=True)
+    events = db.relationship('Event', back_populates='venue', lazy=True)
     
     def __repr__(self):
-        return f'<Venue {self.name}>'
+        return f'<Venue id={_identity(self)}>'
     
     def get_price_for_guests(self, guest_count):
         """Calculate venue price based on guest count"""
@@ -151,6 +231,11 @@ class Venue(db.Model):
 # ============================================
 class Package(db.Model):
     __tablename__ = 'packages'
+    __table_args__ = (
+        flag_index('ix_package_active', 'is_active', 'id'),
+        jsonb_gin_index('ix_package_features_gin', 'features'),
+        jsonb_gin_index('ix_package_services_gin', 'services_included'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False, index=True)
@@ -168,28 +253,28 @@ class Package(db.Model):
     cleanup_time = db.Column(db.Integer, default=1)
     
     # Services and features
-    features = db.Column(db.JSON, default=[])
+    features = db.Column(JSONType, default=[])
     decoration_type = db.Column(db.String(50))
     menu_type = db.Column(db.String(50))
-    menu_items = db.Column(db.JSON, default=[])
-    services_included = db.Column(db.JSON, default=[])
+    menu_items = db.Column(JSONType, default=[])
+    services_included = db.Column(JSONType, default=[])
     
     # Policies
-    cancellation_policy = db.Column(db.Text)
-    additional_notes = db.Column(db.Text)
+    cancellation_policy = deferred(db.Column(db.Text))
+    additional_notes = deferred(db.Column(db.Text))
     
     # Status
-    is_active = db.Column(db.Boolean, default=True, index=True)
+    is_active = db.Column(db.Boolean, default=True)
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    events = db.relationship('Event', backref='package', lazy=True)
+    events = db.relationship('Event', back_populates='package', lazy=True)
     
     def __repr__(self):
-        return f'<Package {self.name}>'
+        return f'<Package id={_identity(self)}>'
     
     def calculate_cost(self, guest_count):
         """Calculate total package cost based on guest count"""
@@ -201,6 +286,10 @@ class Package(db.Model):
 # ============================================
 class Vendor(db.Model):
     __tablename__ = 'vendors'
+    __table_args__ = (
+        flag_index('ix_vendor_available', 'is_available', 'id'),
+        jsonb_gin_index('ix_vendor_services_gin', 'services'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(120), nullable=False, index=True)
@@ -208,7 +297,7 @@ class Vendor(db.Model):
     description = db.Column(db.Text)
     
     # Services
-    services = db.Column(db.JSON, default=[])
+    services = db.Column(JSONType, default=[])
     
     # Pricing
     base_price = db.Column(db.Float)
@@ -227,23 +316,23 @@ class Vendor(db.Model):
     experience_years = db.Column(db.Integer)
     
     # Media
-    portfolio_images = db.Column(db.JSON, default=[])
-    portfolio_links = db.Column(db.JSON, default=[])
+    portfolio_images = db.Column(JSONType, default=[])
+    portfolio_links = db.Column(JSONType, default=[])
     
     # Rating and availability
     rating = db.Column(db.Float, default=0)
     reviews_count = db.Column(db.Integer, default=0)
-    is_available = db.Column(db.Boolean, default=True, index=True)
+    is_available = db.Column(db.Boolean, default=True)
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    event_vendors = db.relationship('EventVendor', backref='vendor', lazy=True, cascade='all, delete-orphan')
+    event_vendors = db.relationship('EventVendor', back_populates='vendor', lazy=True, cascade='all, delete-orphan')
     
     def __repr__(self):
-        return f'<Vendor {self.name}>'
+        return f'<Vendor id={_identity(self)}>'
 
 
 # ============================================
@@ -251,17 +340,25 @@ class Vendor(db.Model):
 # ============================================
 class Event(db.Model):
     __tablename__ = 'events'
+    __table_args__ = (
+        db.Index('ix_event_user_created', 'user_id', 'created_at'),
+        db.Index('ix_event_status_created', 'status', 'created_at'),
+        # Upcoming-event lookups never need cancelled rows
+        db.Index('ix_event_upcoming', 'event_date',
+                 postgresql_where=text("status <> 'CANCELLED'"),
+                 sqlite_where=text("status <> 'CANCELLED'")),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     
     # Basic information
     name = db.Column(db.String(150), nullable=False, index=True)
     event_type = db.Column(db.String(50), nullable=False, index=True)  # Birthday, Wedding, Corporate, etc.
-    description = db.Column(db.Text)
+    # Free-text fields only the detail pages show; loaded there with undefer_group('details')
+    description = deferred(db.Column(db.Text), group='details')
     
     # Date and time
-    event_date = db.Column(db.DateTime, nullable=False, index=True)
-    event_time = db.Column(db.String(5))  # HH:MM format
+    event_date = db.Column(db.DateTime, nullable=False, index=True)  # Start date and time
     estimated_duration = db.Column(db.Integer, default=4)  # Hours
     
     # Guests
@@ -274,12 +371,12 @@ class Event(db.Model):
     package_id = db.Column(db.Integer, db.ForeignKey('packages.id'), index=True)
     
     # Special requirements
-    dietary_requirements = db.Column(db.JSON, default=[])
-    special_requests = db.Column(db.Text)
+    dietary_requirements = db.Column(JSONType, default=[])
+    special_requests = deferred(db.Column(db.Text), group='details')
     
     # Status and tracking
-    status = db.Column(db.Enum(EventStatus), default=EventStatus.PENDING, index=True)
-    admin_notes = db.Column(db.Text)
+    status = db.Column(enum_type(EventStatus), default=EventStatus.PENDING)
+    admin_notes = deferred(db.Column(db.Text), group='details')
     approval_date = db.Column(db.DateTime)
     
     # Payment tracking
@@ -295,49 +392,83 @@ class Event(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    guests = db.relationship('Guest', backref='event', lazy=True, cascade='all, delete-orphan')
-    event_vendors = db.relationship('EventVendor', backref='event', lazy=True, cascade='all, delete-orphan')
-    payments = db.relationship('Payment', backref='event', lazy=True, cascade='all, delete-orphan')
+    client = db.relationship('User', back_populates='events')
+    venue = db.relationship('Venue', back_populates='events')
+    package = db.relationship('Package', back_populates='events')
+    guests = db.relationship('Guest', back_populates='event', lazy=True, cascade='all, delete-orphan')
+    event_vendors = db.relationship('EventVendor', back_populates='event', lazy=True, cascade='all, delete-orphan')
+    payments = db.relationship('Payment', back_populates='event', lazy=True, cascade='all, delete-orphan')
     
     def __repr__(self):
-        return f'<Event {self.name}>'
+        return f'<Event id={_identity(self)}>'
     
     def calculate_total_cost(self):
         """Calculate total cost of the event"""
-        cost = 0
-        
-        # Package cost
-        if self.package:
-            cost += self.package.calculate_cost(self.expected_guest_count)
-        
-        # Venue cost
-        if self.venue:
-            cost += self.venue.get_price_for_guests(self.expected_guest_count)
+        self.recompute_total_cost(self.id)
+        db.session.expire(self, ['total_cost'])
+        return self.total_cost
+    
+    @classmethod
+    def recompute_total_cost(cls, *event_ids):
+        """Recalculate total_cost for any number of events with a single UPDATE"""
+        package_cost = select(
+            Package.base_price + func.coalesce(Package.price_per_guest, 0) * cls.expected_guest_count
+        ).where(Package.id == cls.package_id).scalar_subquery()
+        venue_cost = select(Venue.base_rent).where(Venue.id == cls.venue_id).scalar_subquery()
+        vendor_cost = select(func.sum(EventVendor.total_cost)) \
+            .where(EventVendor.event_id == cls.id).scalar_subquery()
         
-        # Vendor costs
-        for event_vendor in self.event_vendors:
-            cost += event_vendor.total_cost
-        
-        self.total_cost = cost
-        return cost
+        # Pending vendor/guest-count changes must be visible to the UPDATE
+        db.session.flush()
+        db.session.execute(
+            update(cls)
+            .where(cls.id.in_(event_ids))
+            .values(total_cost=func.coalesce(package_cost, 0)
+                    + func.coalesce(venue_cost, 0)
+                    + func.coalesce(vendor_cost, 0))
+            .execution_options(synchronize_session=False)
+        )
+    
+    @classmethod
+    def select_with_total_paid(cls):
+        """SELECT of events paired with the sum of their PAID payments"""
+        return select(cls, func.coalesce(func.sum(Payment.amount), 0.0).label('total_paid')) \
+            .outerjoin(Payment, and_(Payment.event_id == cls.id, Payment.status == PaymentStatus.PAID)) \
+            .group_by(cls.id)
     
     def get_total_paid(self):
-        """Get total amount paid so far"""
-        return sum(p.amount for p in self.payments if p.status == PaymentStatus.PAID)
+        """Get total amount paid so far (summed in the database)"""
+        return db.session.execute(
+            select(func.coalesce(func.sum(Payment.amount), 0.0))
+            .where(Payment.event_id == self.id, Payment.status == PaymentStatus.PAID)
+        ).scalar_one()
     
     def get_remaining_amount(self):
         """Get remaining amount to be paid"""
-        return max(0, self.total_cost - self.get_total_paid())
+        return max(0, (self.total_cost or 0) - self.get_total_paid())
     
     @property
+    def event_time(self):
+        """Start time as HH:MM (stored as part of event_date)"""
+        return self.event_date.strftime('%H:%M') if self.event_date else None
+    
+    @hybrid_property
     def is_upcoming(self):
         """Check if event is upcoming"""
         return self.event_date > datetime.utcnow() and self.status != EventStatus.CANCELLED
     
-    @property
+    @is_upcoming.expression
+    def is_upcoming(cls):
+        return and_(cls.event_date > datetime.utcnow(), cls.status != EventStatus.CANCELLED)
+    
+    @hybrid_property
     def is_editable(self):
         """Check if event can be edited"""
-        return self.status in [EventStatus.PENDING, EventStatus.APPROVED]
+        return self.status in (EventStatus.PENDING, EventStatus.APPROVED)
+    
+    @is_editable.expression
+    def is_editable(cls):
+        return cls.status.in_([EventStatus.PENDING, EventStatus.APPROVED])
 
 
 # ============================================
@@ -356,9 +487,10 @@ class Guest(db.Model):
     
     # Event association
     event_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False, index=True)
+    event = db.relationship('Event', back_populates='guests')
     
     # Dietary and special requirements
-    dietary_restrictions = db.Column(db.JSON, default=[])
+    dietary_restrictions = db.Column(JSONType, default=[])
     special_needs = db.Column(db.Text)
     
     # RSVP tracking
@@ -374,7 +506,7 @@ class Guest(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     def __repr__(self):
-        return f'<Guest {self.first_name} {self.last_name}>'
+        return f'<Guest id={_identity(self)}>'
     
     @property
     def full_name(self):
@@ -386,17 +518,26 @@ class Guest(db.Model):
 # ============================================
 class EventVendor(db.Model):
     __tablename__ = 'event_vendors'
+    __table_args__ = (
+        db.Index('ix_eventvendor_event_vendor', 'event_id', 'vendor_id', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     
     # Foreign keys
     event_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False, index=True)
     vendor_id = db.Column(db.Integer, db.ForeignKey('vendors.id'), nullable=False, index=True)
+    event = db.relationship('Event', back_populates='event_vendors')
+    vendor = db.relationship('Vendor', back_populates='event_vendors', lazy='selectin')  # Always displayed
     
     # Vendor-specific details for this event
     quantity = db.Column(db.Integer, default=1)
     custom_price = db.Column(db.Float)  # If different from standard vendor price
-    custom_services = db.Column(db.JSON, default=[])
+    vendor_price_snapshot = db.Column(db.Float, nullable=False)  # Vendor base price when booked
+    # Line total kept by the database, so event totals need no join to vendors
+    total_cost = db.Column(db.Float, db.Computed(
+        'COALESCE(NULLIF(custom_price, 0), vendor_price_snapshot) * quantity', persisted=True))
+    custom_services = db.Column(JSONType, default=[])
     
     # Booking details
     booking_date = db.Column(db.DateTime, default=datetime.utcnow)
@@ -407,11 +548,59 @@ class EventVendor(db.Model):
     # Notes
     notes = db.Column(db.Text)
     
-    @property
-    def total_cost(self):
-        """Calculate total cost for this vendor assignment"""
-        price = self.custom_price if self.custom_price else (self.vendor.base_price or 0)
-        return price * self.quantity
+    def __repr__(self):
+        return f'<EventVendor id={_identity(self)}>'
+
+
+@sa_event.listens_for(EventVendor, 'before_insert')
+def snapshot_vendor_price(mapper, connection, target):
+    """Copy the vendor's current base price onto a new booking"""
+    if target.vendor_price_snapshot is None:
+        target.vendor_price_snapshot = connection.scalar(
+            select(Vendor.base_price).where(Vendor.id == target.vendor_id)) or 0
+
+
+# ============================================
+# BILLING PROFILE MODEL
+# ============================================
+class BillingProfile(db.Model):
+    """Billing details a user pays under, referenced by their payments.
+    
+    Payments point at the live profile rather than copying it, so editing a
+    profile also changes what older payments show. If invoices ever have to
+    preserve the details as billed, snapshot them on Payment at that point.
+    """
+    __tablename__ = 'billing_profiles'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    user = db.relationship('User', back_populates='billing_profiles')
+    
+    name = db.Column(db.String(120))
+    email = db.Column(db.String(120))
+    phone = db.Column(db.String(20))
+    address = db.Column(db.Text)
+    gst_number = db.Column(db.String(20))
+    
+    # Timestamps
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relationships
+    payments = db.relationship('Payment', back_populates='billing_profile', lazy=True)
+    
+    def __repr__(self):
+        return f'<BillingProfile id={_identity(self)}>'
+    
+    @classmethod
+    def for_user(cls, user):
+        """The user's current profile, started from their account details on first payment"""
+        profile = cls.query.filter_by(user_id=user.id).order_by(cls.id.desc()).first()
+        if profile is None:
+            profile = cls(user_id=user.id, name=user.full_name, email=user.email,
+                          phone=user.phone, address=user.address)
+            db.session.add(profile)
+        return profile
 
 
 # ============================================
@@ -419,28 +608,37 @@ class EventVendor(db.Model):
 # ============================================
 class Payment(db.Model):
     __tablename__ = 'payments'
+    __table_args__ = (
+        db.Index('ix_payment_event_created', 'event_id', 'created_at'),
+        # Covers the per-event paid sum, so it never touches the table
+        db.Index('ix_payment_event_status', 'event_id', 'status', 'amount'),
+        # Revenue totals read only paid rows
+        db.Index('ix_payment_paid_amount', 'amount',
+                 postgresql_where=text("status = 'PAID'"),
+                 sqlite_where=text("status = 'PAID'")),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     
     # Association
     event_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False, index=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    event = db.relationship('Event', back_populates='payments')
+    user = db.relationship('User', back_populates='payments')
     
     # Payment details
     amount = db.Column(db.Float, nullable=False)
-    status = db.Column(db.Enum(PaymentStatus), default=PaymentStatus.PENDING, index=True)
+    status = db.Column(enum_type(PaymentStatus), default=PaymentStatus.PENDING)
     payment_method = db.Column(db.String(50))  # Credit Card, Debit Card, UPI, Net Banking, etc.
     
     # Transaction information
     transaction_id = db.Column(db.String(100), unique=True)
     receipt_number = db.Column(db.String(50))
     
-    # Billing information
-    billing_name = db.Column(db.String(120))
-    billing_email = db.Column(db.String(120))
-    billing_phone = db.Column(db.String(20))
-    billing_address = db.Column(db.Text)
-    gst_number = db.Column(db.String(20))
+    # Billing information (shared per user; see BillingProfile)
+    billing_profile_id = db.Column(db.Integer, db.ForeignKey('billing_profiles.id', name='fk_payments_billing_profile_id'),
+                                   index=True)
+    billing_profile = db.relationship('BillingProfile', back_populates='payments')
     
     # Dates
     payment_date = db.Column(db.DateTime)
@@ -461,7 +659,7 @@ class Payment(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     def __repr__(self):
-        return f'<Payment {self.transaction_id}>'
+        return f'<Payment id={_identity(self)}>'
 
 
 # ============================================
@@ -469,6 +667,11 @@ class Payment(db.Model):
 # ============================================
 class AuditLog(db.Model):
     __tablename__ = 'audit_logs'
+    __table_args__ = (
+        # Append-only, so created_at follows physical order; BRIN stays tiny on PostgreSQL
+        db.Index('ix_audit_log_created', 'created_at',
+                 postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     
@@ -478,16 +681,16 @@ class AuditLog(db.Model):
     entity_id = db.Column(db.Integer)
     
     # Admin who performed the action
-    admin_id = db.Column(db.Integer, db.ForeignKey('users.id'))
-    admin = db.relationship('User', backref='audit_logs')
+    admin_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'))
+    admin = db.relationship('User', back_populates='audit_logs')
     
     # Details
-    old_values = db.Column(db.JSON)
-    new_values = db.Column(db.JSON)
+    old_values = deferred(db.Column(CompressedJSON), group='values')
+    new_values = deferred(db.Column(CompressedJSON), group='values')
     description = db.Column(db.Text)
     
     # Timestamp
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     def __repr__(self):
-        return f'<AuditLog {self.action} on {self.entity_type}>'
+        return f'<AuditLog id={_identity(self)}>'
@@ -1,5 +1,7 @@
-# Auto-generated wsgi to expose Flask app for gunicorn/render
-from app import app
+# WSGI entry point for gunicorn/render (settings in gunicorn.conf.py)
+from app import create_app
+
+app = create_app()
 
 if __name__ == '__main__':
     app.run()